@@ -18,6 +18,9 @@ os.makedirs(bls_key_folder, exist_ok=True)
 
 node_pid = -1
 interaction_memory = set()
+activation_tx = {}  # Last activation tx sent by `check_and_activate`: hash, nonce, epoch & confirmed.
+activation_max_backoff_ticks = 8  # Most ticks to wait before resending an activation that produced no tx.
+rpc_errors = (json.JSONDecodeError, requests.exceptions.RequestException, RuntimeError)
 
 
 class INTERACT:
@@ -221,11 +224,108 @@ def setup_validator(val_info, bls_pub_keys):
             create_new_validator(val_info, bls_pub_keys, bls_passphrase, args.endpoint)
 
 
+def should_resend_activation(curr_epoch):
+    """
+    Polls (without waiting) the tracked activation transaction.
+    Returns True if a new activation transaction should be sent: the tracked one failed or left the pool
+    without being included, or it was confirmed (or could not be polled) and its epoch has passed with the
+    validator still inactive. If the last send produced no transaction, returns True once its backoff is over.
+    Returns False while the tracked transaction is pending, or confirmed within the current epoch.
+    """
+    tx_hash = activation_tx["hash"]
+    if tx_hash is None:
+        activation_tx["backoff"] -= 1
+        return activation_tx["backoff"] <= 0
+    if activation_tx["confirmed"]:
+        return curr_epoch > activation_tx["epoch"]
+    try:
+        receipt = get_transaction_receipt(tx_hash, args.endpoint)
+        if receipt is None:
+            if get_pending_staking_transaction(tx_hash, args.endpoint) is not None:
+                print(f"{Typgpy.OKBLUE}Activation transaction {tx_hash} is pending{Typgpy.ENDC}")
+                return False
+            # Tx could have been mined after the receipt was fetched, so re-check before calling it dropped.
+            receipt = get_transaction_receipt(tx_hash, args.endpoint)
+            if receipt is None:
+                print(f"{Typgpy.FAIL}Activation transaction {tx_hash} was dropped from the pool{Typgpy.ENDC}")
+                return True
+    except rpc_errors as e:
+        print(f"{Typgpy.FAIL}Warning failed to check activation transaction {e}{Typgpy.ENDC}")
+        return curr_epoch > activation_tx["epoch"]
+    try:
+        status = int(str(receipt["status"]), 0)
+    except (KeyError, ValueError) as e:
+        print(f"{Typgpy.FAIL}Warning unknown activation transaction receipt status {e}{Typgpy.ENDC}")
+        return curr_epoch > activation_tx["epoch"]
+    if status != 1:
+        print(f"{Typgpy.FAIL}Activation transaction {tx_hash} failed{Typgpy.ENDC}")
+        return True
+    print(f"{Typgpy.OKGREEN}Activation transaction {tx_hash} confirmed, "
+          f"waiting for next epoch to take effect{Typgpy.ENDC}")
+    activation_tx["confirmed"] = True
+    activation_tx["epoch"] = curr_epoch
+    return False
+
+
+def get_pending_activation_tx(address):
+    """
+    Returns the hash & nonce of an edit-validator transaction from `address` in the transaction pool, or None.
+    """
+    try:
+        pending_txs = get_pending_staking_transactions(args.endpoint) or []
+    except rpc_errors as e:
+        print(f"{Typgpy.FAIL}Warning failed to get pending staking transactions {e}{Typgpy.ENDC}")
+        return None
+    for tx in pending_txs:
+        if tx.get("type") == "EditValidator" and str(tx.get("from", "")).lower() == address.lower():
+            try:
+                return tx["hash"], int(str(tx["nonce"]), 0)
+            except (KeyError, ValueError):
+                return tx.get("hash", None), None
+    return None
+
+
 def check_and_activate(address, epos_status_msg):
-    if "not eligible" in epos_status_msg or "not signing" in epos_status_msg:
-        print(f"{Typgpy.FAIL}Node not active, reactivating...{Typgpy.ENDC}")
-        cli.single_call(f"hmy staking edit-validator --validator-addr {address} "
-                        f"--active true --node {args.endpoint} --passphrase-file /.wallet_passphrase ")
+    if "not eligible" not in epos_status_msg and "not signing" not in epos_status_msg:
+        activation_tx.clear()
+        return
+    try:
+        curr_epoch = get_current_epoch(args.endpoint)
+    except rpc_errors + (KeyError,) as e:
+        print(f"{Typgpy.FAIL}Warning failed to get current epoch, skipping reactivation {e}{Typgpy.ENDC}")
+        return
+    if activation_tx and not should_resend_activation(curr_epoch):
+        return
+    failed_sends = activation_tx.get("failed_sends", 0)  # Only set on entries for sends that produced no tx.
+    activation_tx.clear()
+    print(f"{Typgpy.FAIL}Node not active, reactivating...{Typgpy.ENDC}")
+    try:
+        response = cli.single_call(f"hmy staking edit-validator --validator-addr {address} "
+                                   f"--active true --node {args.endpoint} --passphrase-file /.wallet_passphrase ")
+    except RuntimeError as e:
+        response = str(e)
+    tx_hash = get_tx_hash_from_cli_response(response)
+    if tx_hash is None:
+        pending_tx = get_pending_activation_tx(address)
+        if pending_tx is not None and pending_tx[0] is not None:
+            # The pool already holds an edit-validator tx from this account (likely rejecting ours), so track it.
+            tx_hash, nonce = pending_tx
+            print(f"{Typgpy.OKBLUE}Tracking pending activation transaction {tx_hash} with nonce {nonce}{Typgpy.ENDC}")
+            activation_tx.update({"hash": tx_hash, "nonce": nonce, "epoch": curr_epoch, "confirmed": False})
+            return
+        failed_sends += 1
+        backoff = min(2 ** (failed_sends - 1), activation_max_backoff_ticks)
+        print(f"{Typgpy.FAIL}Activation transaction not sent, retrying in {backoff} tick(s).\n"
+              f"\tMsg:\n{response}{Typgpy.ENDC}")
+        activation_tx.update({"hash": None, "backoff": backoff, "failed_sends": failed_sends})
+        return
+    try:
+        nonce = get_staking_transaction_nonce(tx_hash, args.endpoint)
+    except rpc_errors + (KeyError, ValueError) as e:
+        print(f"{Typgpy.FAIL}Warning failed to get activation transaction nonce {e}{Typgpy.ENDC}")
+        nonce = None
+    print(f"{Typgpy.OKBLUE}Sent activation transaction {tx_hash} with nonce {nonce}{Typgpy.ENDC}")
+    activation_tx.update({"hash": tx_hash, "nonce": nonce, "epoch": curr_epoch, "confirmed": False})
 
 
 def can_check_blockchain(shard_endpoint):
@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import subprocess
 import stat
 import sys
@@ -110,6 +111,72 @@ def get_validator_information(address, endpoint=default_endpoint):
     return body['result']
 
 
+def get_transaction_receipt(tx_hash, endpoint=default_endpoint):
+    """
+    Returns the receipt of the given (staking) transaction hash, or None if it has not been included in a block yet.
+    """
+    payload = json.dumps({"id": "1", "jsonrpc": "2.0",
+                          "method": "hmy_getTransactionReceipt",
+                          "params": [tx_hash]})
+    headers = {
+        'Content-Type': 'application/json'
+    }
+    response = requests.request('POST', endpoint, headers=headers, data=payload, allow_redirects=False, timeout=3)
+    body = json.loads(response.content)
+    if 'error' in body:
+        raise RuntimeError(str(body['error']))
+    return body['result']
+
+
+def get_staking_transaction_by_hash(tx_hash, endpoint=default_endpoint):
+    """
+    Returns the given staking transaction, or None if it has not been included in a block yet.
+    """
+    payload = json.dumps({"id": "1", "jsonrpc": "2.0",
+                          "method": "hmy_getStakingTransactionByHash",
+                          "params": [tx_hash]})
+    headers = {
+        'Content-Type': 'application/json'
+    }
+    response = requests.request('POST', endpoint, headers=headers, data=payload, allow_redirects=False, timeout=3)
+    body = json.loads(response.content)
+    if 'error' in body:
+        raise RuntimeError(str(body['error']))
+    return body['result']
+
+
+def get_pending_staking_transactions(endpoint=default_endpoint):
+    payload = json.dumps({"id": "1", "jsonrpc": "2.0",
+                          "method": "hmy_pendingStakingTransactions",
+                          "params": []})
+    headers = {
+        'Content-Type': 'application/json'
+    }
+    response = requests.request('POST', endpoint, headers=headers, data=payload, allow_redirects=False, timeout=3)
+    body = json.loads(response.content)
+    if 'error' in body:
+        raise RuntimeError(str(body['error']))
+    return body['result']
+
+
+def get_pending_staking_transaction(tx_hash, endpoint=default_endpoint):
+    """
+    Returns the given staking transaction if it is in the transaction pool, otherwise None.
+    """
+    return next((t for t in get_pending_staking_transactions(endpoint) or [] if t.get("hash") == tx_hash), None)
+
+
+def get_staking_transaction_nonce(tx_hash, endpoint=default_endpoint):
+    """
+    Returns the nonce the given staking transaction was signed with, looking in the transaction pool
+    if it has not been included in a block yet. Returns None if the transaction cannot be found.
+    """
+    tx = get_staking_transaction_by_hash(tx_hash, endpoint)
+    if tx is None:
+        tx = get_pending_staking_transaction(tx_hash, endpoint)
+    return int(str(tx["nonce"]), 0) if tx is not None else None
+
+
 """
 VALIDATOR FUNCTIONS ARE BELOW
 """
@@ -217,6 +284,24 @@ def send_create_validator_tx(val_info, bls_pub_keys, passphrase, endpoint):
     directory_lock.release()
 
 
+def get_tx_hash_from_cli_response(response):
+    """
+    Returns the transaction hash from the output of a `hmy staking ...` call, or None if there is none.
+    The output is either the RPC reply with the hash as `result`, or the transaction receipt as `result`
+    if the CLI waited for confirmation.
+    """
+    try:
+        body = json_load(response)
+    except (json.JSONDecodeError, RuntimeError):
+        return None
+    tx_hash = body.get("result", None) if isinstance(body, dict) else None
+    if isinstance(tx_hash, dict):
+        tx_hash = tx_hash.get("transactionHash", None)
+    if isinstance(tx_hash, str) and re.fullmatch(r"0x[0-9a-fA-F]{64}", tx_hash):
+        return tx_hash
+    return None
+
+
 """
 NODE FUNCTIONS ARE BELOW
 """